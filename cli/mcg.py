@@ -7,6 +7,9 @@ import argparse
 from typing import Dict, Any
 from pathlib import Path
 
+# Print a numerical κ(T) summary once a sweep has at least this many points
+KAPPA_SUMMARY_MIN_POINTS = 8
+
 # For demonstration, simulate MCP calls
 # In production, would use proper MCP client library
 
@@ -77,7 +80,7 @@ class MCGClient:
         """Explain results in plain language"""
         # Get results and ledger
         results = self.compute.results(run_id)
-        ledger = self.memory.ledger({"run_id": run_id})
+        ledger = self.memory.ledger(run_id=run_id)
         
         # Generate explanation
         return self.interfaces.explain(
@@ -149,8 +152,8 @@ class ComputeMCP:
         
         # Execute using config-based runner
         try:
-            from compute_mcp.generic_runner import GenericRunner
-            runner = GenericRunner()
+            from compute_mcp.generic_runner import get_runner
+            runner = get_runner()
             result = runner.run(runner_kind, run_obj, assets, params)
             
             # Store results in shared memory  
@@ -177,11 +180,14 @@ class ComputeMCP:
     def get_available_runners(self) -> list:
         """Get list of available runners from loaded configurations"""
         try:
-            from compute_mcp.generic_runner import GenericRunner
-            runner = GenericRunner()
+            from compute_mcp.generic_runner import get_runner
+            runner = get_runner()
+            runner.refresh_configs()
             # Get runner names from loaded configs
             available = []
             for key, config in runner.configs.items():
+                if not config:
+                    continue
                 name = config.get('name', key)
                 if name not in available:
                     available.append(name)
@@ -265,14 +271,9 @@ class MemoryMCP:
         edges = self.store.query_edges(**kwargs)
         return [e.to_dict() for e in edges]
     
-    def ledger(self, query) -> list:
-        """Query ledger"""
-        edges = self.store.query_edges(
-            from_id=query.get("from"),
-            to_id=query.get("to"),
-            run_id=query.get("run_id")
-        )
-        return [e.to_dict() for e in edges]
+    def ledger(self, **kwargs) -> list:
+        """Query ledger (kwargs: from_id, to_id, run_id)"""
+        return [e.to_dict() for e in self.store.query_edges(**kwargs)]
 
 def main():
     """Main CLI entry point"""
@@ -446,16 +447,7 @@ Examples:
                 print(f"Results saved to {args.output}")
             else:
                 # Pretty print results
-                for asset in results.get("assets", []):
-                    if asset["type"] == "Results":
-                        payload = asset["payload"]
-                        if "kappa_W_per_mK" in payload:
-                            print("\nThermal Conductivity Results:")
-                            print(f"Method: {payload.get('method', 'N/A')}")
-                            print(f"Supercell: {payload.get('supercell', 'N/A')}")
-                            print("\nκ(T) values:")
-                            for T, k in zip(payload["T_K"], payload["kappa_W_per_mK"]):
-                                print(f"  {T} K: {k:.2f} W/(m·K)")
+                _print_kappa_results(results)
         
         elif args.command == "explain":
             explanation = client.explain(args.run_id)
@@ -521,16 +513,7 @@ Examples:
                 print(f"Results saved to: {args.output}")
             
             # Pretty print results summary
-            for asset in results.get("assets", []):
-                if asset["type"] == "Results":
-                    payload = asset["payload"]
-                    if "kappa_W_per_mK" in payload:
-                        print("\nThermal Conductivity Results:")
-                        print(f"Method: {payload.get('method', 'N/A')}")
-                        print(f"Supercell: {payload.get('supercell', 'N/A')}")
-                        print("\nκ(T) values:")
-                        for T, k in zip(payload["T_K"], payload["kappa_W_per_mK"]):
-                            print(f"  {T} K: {k:.2f} W/(m·K)")
+            _print_kappa_results(results)
     
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -538,6 +521,31 @@ Examples:
 
 
 
+def _print_kappa_results(results: dict) -> None:
+    """Pretty print thermal conductivity results with a single write"""
+    lines = []
+    for asset in results.get("assets", []):
+        if asset["type"] != "Results":
+            continue
+        payload = asset["payload"]
+        if "kappa_W_per_mK" not in payload:
+            continue
+
+        lines.append("\nThermal Conductivity Results:")
+        lines.append(f"Method: {payload.get('method', 'N/A')}")
+        lines.append(f"Supercell: {payload.get('supercell', 'N/A')}")
+        lines.append("\nκ(T) values:")
+        lines.extend(f"  {T} K: {k:.2f} W/(m·K)" for T, k in zip(payload["T_K"], payload["kappa_W_per_mK"]))
+
+        if min(len(payload["T_K"]), len(payload["kappa_W_per_mK"])) >= KAPPA_SUMMARY_MIN_POINTS:
+            from common.analysis import summarize_kappa
+            mean, k_min, k_max, slope = summarize_kappa(payload["T_K"], payload["kappa_W_per_mK"])
+            lines.append(f"\nSummary: mean {mean:.2f}, range {k_min:.2f}-{k_max:.2f} W/(m·K), dκ/dT {slope:.4f} W/(m·K²)")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
 def _execute_general_workflow(client, plan: dict) -> list:
     """Execute general multi-step workflow using workflow_steps"""
     workflow_steps = plan.get("workflow_steps", [])
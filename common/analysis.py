@@ -0,0 +1,16 @@
+"""Numerical post-processing helpers for MCG results"""
+from typing import Sequence, Tuple
+
+import numpy as np
+
+def summarize_kappa(T_K: Sequence[float], kappa: Sequence[float]) -> Tuple[float, float, float, float]:
+    """Summarize κ(T) as (mean, min, max, slope dκ/dT) using vectorized NumPy reductions.
+
+    Both series are truncated to their common length, like the zip()ed table;
+    the slope is 0.0 when fewer than two points or a single temperature remain.
+    """
+    n = min(len(T_K), len(kappa))
+    T = np.asarray(T_K[:n], dtype=np.float64)
+    k = np.asarray(kappa[:n], dtype=np.float64)
+    slope = float(np.polyfit(T, k, 1)[0]) if n > 1 and np.ptp(T) > 0 else 0.0
+    return float(k.mean()), float(k.min()), float(k.max()), slope
@@ -2,29 +2,43 @@
 import hashlib
 import json
 import uuid
+from types import MappingProxyType
 from typing import Any, Dict
 
+# Read-only asset type -> ID prefix table, built once at import
+ASSET_PREFIXES = MappingProxyType({
+    "System": "S",
+    "Method": "M",
+    "Params": "P",
+    "Results": "R",
+    "Artifact": "A"
+})
+
 def generate_id(prefix: str = "") -> str:
     """Generate a unique ID with optional prefix"""
     uid = str(uuid.uuid4())[:8]
     return f"{prefix}{uid}" if prefix else uid
 
+def _hash_default(obj: Any) -> Any:
+    """json.dumps fallback for NumPy values: encode them exactly as the equivalent Python lists/numbers"""
+    if hasattr(obj, "dtype") and hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def hash_dict(data: Dict[str, Any]) -> str:
-    """Generate deterministic hash for a dictionary"""
+    """Generate deterministic hash for a dictionary (NumPy values hash like their list form)"""
     # Sort keys to ensure deterministic serialization
-    json_str = json.dumps(data, sort_keys=True, ensure_ascii=True)
+    json_str = json.dumps(data, sort_keys=True, ensure_ascii=True, default=_hash_default)
     return hashlib.sha256(json_str.encode()).hexdigest()[:16]
 
+def content_hash(data: Any) -> str:
+    """Full BLAKE2b content hash of a JSON-serializable value"""
+    json_str = json.dumps(data, sort_keys=True, ensure_ascii=True, default=_hash_default)
+    return hashlib.blake2b(json_str.encode(), digest_size=16).hexdigest()
+
 def asset_id(asset_type: str, payload: Dict[str, Any]) -> str:
     """Generate deterministic ID for an asset based on type and payload"""
-    prefix_map = {
-        "System": "S",
-        "Method": "M",
-        "Params": "P",
-        "Results": "R",
-        "Artifact": "A"
-    }
-    prefix = prefix_map.get(asset_type, "X")
+    prefix = ASSET_PREFIXES.get(asset_type, "X")
     hash_suffix = hash_dict(payload)[:6]
     return f"{prefix}{hash_suffix}"
 
@@ -3,12 +3,31 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
 import json
+import sys
+
+from common.ids import content_hash
 
 AssetType = Literal["System", "Method", "Params", "Results", "Artifact"]
 RunStatus = Literal["queued", "running", "done", "error"]
 EdgeRelation = Literal["USES", "PRODUCES", "DERIVES", "CONFIGURES", "LOGS"]
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports it
+_DATACLASS_OPTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_SYSTEM_REQUIRED = frozenset({"atoms", "lattice", "pbc"})
+_VALID_FAMILIES = frozenset({"DFT", "MD", "LD", "ML", "QM"})
+_VALID_DEVICES = frozenset({"CPU", "GPU", "TPU"})
+
+def _intern_fields(data: Dict[str, Any], keys: tuple) -> Dict[str, Any]:
+    """Shallow copy of data with the string values under keys interned; the input is not modified"""
+    data = dict(data)
+    for key in keys:
+        value = data.get(key)
+        if type(value) is str:
+            data[key] = sys.intern(value)
+    return data
+
+@dataclass(**_DATACLASS_OPTS)
 class Asset:
     """MCG-lite Asset"""
     type: AssetType
@@ -32,11 +51,15 @@ class Asset:
             d["hash"] = self.hash
         return d
     
+    def content_hash(self) -> str:
+        """Return the content hash of the current payload (independent of the free-form hash field)"""
+        return content_hash(self.payload)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Asset":
-        return cls(**data)
+        return cls(**_intern_fields(data, ("type",)))
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class Run:
     """Run record for compute operations"""
     id: str
@@ -62,9 +85,9 @@ class Run:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Run":
-        return cls(**data)
+        return cls(**_intern_fields(data, ("kind", "status")))
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class Edge:
     """Lineage edge in the provenance graph"""
     from_id: str  # Asset.id or Run.id (renamed from 'from' to avoid keyword conflict)
@@ -85,20 +108,20 @@ class Edge:
         return cls(
             from_id=data["from"],
             to_id=data["to"],
-            rel=data["rel"],
+            rel=sys.intern(data["rel"]),
             t=data["t"]
         )
 
 def validate_system(payload: Dict[str, Any]) -> bool:
     """Validate System payload schema"""
-    required = {"atoms", "lattice", "pbc"}
-    if not required.issubset(payload.keys()):
+    if not _SYSTEM_REQUIRED.issubset(payload.keys()):
         return False
     
     # Check atoms structure
-    if not isinstance(payload["atoms"], list):
+    atoms = payload["atoms"]
+    if not isinstance(atoms, list):
         return False
-    for atom in payload["atoms"]:
+    for atom in atoms:
         if not isinstance(atom, dict) or "el" not in atom or "pos" not in atom:
             return False
         if not isinstance(atom["pos"], list) or len(atom["pos"]) != 3:
@@ -112,11 +135,9 @@ def validate_system(payload: Dict[str, Any]) -> bool:
             return False
     
     # Check pbc
-    if not isinstance(payload["pbc"], list) or len(payload["pbc"]) != 3:
+    pbc = payload["pbc"]
+    if not isinstance(pbc, list) or len(pbc) != 3 or not all(type(b) is bool for b in pbc):
         return False
-    for b in payload["pbc"]:
-        if not isinstance(b, bool):
-            return False
     
     return True
 
@@ -124,13 +145,10 @@ def validate_method(payload: Dict[str, Any]) -> bool:
     """Validate Method payload schema"""
     if "family" not in payload or "code" not in payload:
         return False
-    
-    valid_families = {"DFT", "MD", "LD", "ML", "QM"}
-    valid_devices = {"CPU", "GPU", "TPU"}
 
-    if payload["family"] not in valid_families:
+    if payload["family"] not in _VALID_FAMILIES:
         return False
-    if "device" in payload and payload["device"] not in valid_devices:
+    if "device" in payload and payload["device"] not in _VALID_DEVICES:
         return False
     
     return True
@@ -142,4 +160,4 @@ def validate_asset(asset: Asset) -> bool:
     elif asset.type == "Method":
         return validate_method(asset.payload)
     # Params, Results, and Artifacts have free-form payloads
-    return True
\ No newline at end of file
+    return True
@@ -6,18 +6,385 @@ or parameter types. Everything is driven purely by configuration files.
 
 import os
 import re
+import errno
 import json
-import tempfile
-import subprocess
+import fnmatch
+import shlex
+import shutil
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from collections import ChainMap
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from itertools import islice
 from typing import Dict, List, Any, Optional
 import string
+import sys
+import logging
 
 
 from common.schema import Asset, Edge, Run
 from common.ids import asset_id, generate_id
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to stdlib json
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Package root (for relative template files) and default config directory
+PACKAGE_ROOT = Path(__file__).parent.parent
+DEFAULT_CONFIG_DIR = PACKAGE_ROOT / "configs"
+
+@lru_cache(maxsize=512)
+def _compile(pattern: str) -> "re.Pattern":
+    """Compile a config-supplied regex once"""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=256)
+def _template(text: str, escapes: tuple = ()) -> string.Template:
+    """Return a shared string.Template for a config-supplied template string.
+
+    ``escapes`` holds (original, replacement) pairs applied to the text first.
+    """
+    for original, replacement in escapes:
+        text = text.replace(original, replacement)
+    return string.Template(text)
+
+
+# Leading inline flag groups such as (?i), which must stay at the very start of a pattern
+_INLINE_FLAGS_RE = re.compile(r'(?:\(\?[aiLmsux]+\))*')
+
+
+@lru_cache(maxsize=128)
+def _compile_parser_patterns(patterns: tuple, anchored: bool = False) -> tuple:
+    """Compile a regex parser's pattern list once, skipping patterns that do not compile.
+
+    With ``anchored`` each pattern must match at the start of a line, so the
+    engine only attempts a match once per line instead of at every offset.
+    """
+    flags = re.MULTILINE if anchored else 0
+    compiled = []
+    for pattern in patterns:
+        source = pattern
+        if anchored:
+            inline_flags = _INLINE_FLAGS_RE.match(pattern).group(0)
+            source = f'{inline_flags}^(?:{pattern[len(inline_flags):]})'
+        try:
+            compiled.append(re.compile(source, flags))
+        except re.error as e:
+            logger.warning("Skipping invalid parser pattern %r: %s", pattern, e)
+    return tuple(compiled)
+
+
+def _scan_matches(regex: "re.Pattern", content: str, mode: str):
+    """Apply a regex in the given parser mode; a falsy result means no match"""
+    if mode == 'first':
+        match = regex.search(content)
+        return _match_value(match) if match else None
+    if mode == 'last':
+        match = None
+        for match in regex.finditer(content):
+            pass
+        return _match_value(match) if match else None
+    if mode == 'count':
+        return sum(1 for _ in regex.finditer(content))
+    return regex.findall(content)
+
+
+def _match_value(match: "re.Match"):
+    """Value of one match, shaped like a findall() item"""
+    groups = match.groups(default='')
+    if not groups:
+        return match.group(0)
+    return groups[0] if len(groups) == 1 else groups
+
+
+# Default timeout (seconds) for _execute_local when the config sets none
+LOCAL_EXECUTION_TIMEOUT = 3600
+# Characters of child stdout/stderr echoed by _execute_local
+OUTPUT_PREVIEW_CHARS = 500
+# Commands containing any of these need /bin/sh; everything else is exec'd directly
+_SHELL_SYNTAX_RE = re.compile(r'[|&;<>()$`\\"\'*?\[\]~{}#\n]')
+# Builtins have no executable to exec; commands starting with them go to /bin/sh
+_SHELL_BUILTINS = frozenset({
+    '.', ':', 'alias', 'bg', 'break', 'cd', 'command', 'continue', 'eval', 'exec',
+    'exit', 'export', 'fg', 'getopts', 'hash', 'jobs', 'read', 'readonly', 'return',
+    'set', 'shift', 'source', 'times', 'trap', 'type', 'ulimit', 'umask', 'unalias',
+    'unset', 'wait',
+})
+
+# Sentinel for "no default", distinct from a default of None
+_MISSING = object()
+# Run-control params left out of the Results payload
+_EXCLUDED_RESULT_PARAMS = frozenset({'method', 'execution_mode'})
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO8601 string without offset, as stored in run and edge records"""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _command_args(command: str, search_path: Optional[str] = None):
+    """Return (args, shell): an argv list to exec directly, or the command string for /bin/sh.
+
+    Commands using shell syntax, VAR=value prefixes or builtins still go through
+    the shell, as do programs not found on ``search_path`` (default: $PATH), so
+    the shell reports them exactly as before.
+    """
+    argv = None if _SHELL_SYNTAX_RE.search(command) else shlex.split(command)
+    if (argv and '=' not in argv[0] and argv[0] not in _SHELL_BUILTINS
+            and shutil.which(argv[0], path=search_path) is not None):
+        return argv, False
+    return command, True
+
+
+def _run_command(run, command: str, args, use_shell: bool, *run_args, **run_kwargs):
+    """Call ``run`` with the args from _command_args, falling back to /bin/sh for shebang-less scripts.
+
+    The shell runs an executable text file without a ``#!`` line itself, but
+    execve rejects it with ENOEXEC, so such commands are retried through the shell.
+    """
+    try:
+        return run(args, *run_args, shell=use_shell, **run_kwargs)
+    except OSError as e:
+        if use_shell or e.errno != errno.ENOEXEC:
+            raise
+    return run(command, *run_args, shell=True, **run_kwargs)
+
+
+@lru_cache(maxsize=256)
+def _optional_placeholders(template: str) -> tuple:
+    """Names of the bare ``{name}`` placeholders in a script template, in order of first use"""
+    return tuple(dict.fromkeys(re.findall(r'\{(\w+)\}', template)))
+
+
+class _BlankMissing(ChainMap):
+    """format_map mapping that renders missing bare placeholders as empty strings.
+
+    Other missing keys (attribute/index lookups, fields with a format spec)
+    still raise KeyError.
+    """
+
+    def __init__(self, optional: tuple, *maps):
+        super().__init__(*maps)
+        self.optional = optional
+
+    def __missing__(self, key):
+        if key in self.optional:
+            return ''
+        raise KeyError(key)
+
+
+@lru_cache(maxsize=256)
+def _compile_formula(formula: str):
+    """Compile a computed_value formula into a closure over the context.
+
+    Recognizes the step-count and supercell-index forms; the substring tests
+    run once per distinct formula instead of on every render.
+    """
+    equil_steps = 'equil_ps * 1000 / timestep_fs' in formula
+    prod_steps = 'prod_ps * 1000 / timestep_fs' in formula
+    index = next((i for i in range(3) if f'[{i}]' in formula), None)
+
+    def evaluate(context: Dict, default: Any) -> Any:
+        if equil_steps and 'equil_ps' in context and 'timestep_fs' in context:
+            try:
+                return int(context['equil_ps'] * 1000 / context['timestep_fs'])
+            except Exception:
+                pass
+
+        if prod_steps and 'prod_ps' in context and 'timestep_fs' in context:
+            try:
+                return int(context['prod_ps'] * 1000 / context['timestep_fs'])
+            except Exception:
+                pass
+
+        if 'supercell' in context:
+            supercell = context['supercell']
+            if not isinstance(supercell, list):
+                return supercell
+            if index is not None:
+                return supercell[index] if len(supercell) > index else 10
+
+        return default
+
+    return evaluate
+
+
+def _static_render(template: str) -> Optional[bytes]:
+    """UTF-8 rendering of a template with no format fields, or None if it has any"""
+    try:
+        if any(field is not None for _, field, _, _ in string.Formatter().parse(template)):
+            return None
+        return template.format_map({}).encode('utf-8')
+    except ValueError:
+        # Malformed braces: leave it to format_map at run time to report
+        return None
+
+
+def _run_capturing_head(args, limit: int, timeout: Optional[float], **popen_kwargs) -> tuple:
+    """Run a process to completion keeping only the first ``limit`` bytes of stdout and stderr.
+
+    Returns (returncode, stdout_head, stderr_head); the rest of the output is
+    drained and discarded, so memory stays bounded however verbose the child is.
+    """
+    # Imported here: only runs that execute a command need them
+    import selectors
+    import subprocess
+
+    if os.name == 'nt':
+        # selectors cannot wait on pipes on Windows
+        result = subprocess.run(args, capture_output=True, timeout=timeout, **popen_kwargs)
+        return result.returncode, result.stdout[:limit], result.stderr[:limit]
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **popen_kwargs) as proc:
+        heads = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+        with selectors.DefaultSelector() as selector:
+            for stream in heads:
+                selector.register(stream, selectors.EVENT_READ)
+            while selector.get_map():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    proc.kill()
+                    raise subprocess.TimeoutExpired(args, timeout)
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        continue
+                    head = heads[key.fileobj]
+                    if len(head) < limit:
+                        head += chunk[:limit - len(head)]
+        # The child may close its pipes and keep running; the deadline still applies
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+        try:
+            returncode = proc.wait(timeout=remaining)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise subprocess.TimeoutExpired(args, timeout)
+    return returncode, bytes(heads[proc.stdout]), bytes(heads[proc.stderr])
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON config or output file, with orjson when available"""
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict (e.g. rejects NaN/Infinity); let stdlib json decide
+            pass
+    return json.loads(data)
+
+
+def _result_units(config: Dict) -> Dict[str, str]:
+    """Map of result key -> unit declared in a config's results.format"""
+    results_format = config.get('results', {}).get('format', {})
+    return {key: spec['unit'] for key, spec in results_format.items() if 'unit' in spec}
+
+
+def _scan_files(directory: Path) -> List[tuple]:
+    """List (name, path) of the regular files directly inside a directory in one scandir pass"""
+    try:
+        with os.scandir(directory) as it:
+            return [(entry.name, entry.path) for entry in it if entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+@lru_cache(maxsize=256)
+def _glob_regex(pattern: str) -> "re.Pattern":
+    """Compile a single-component glob pattern to a regex, with the platform's case rules"""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def _glob_entries(entries: List[tuple], directory: Path, pattern: str) -> List[Path]:
+    """Match a glob pattern against scanned files like Path.glob; nested patterns fall back to it"""
+    if '/' in pattern or os.sep in pattern:
+        return [path for path in directory.glob(pattern) if path.is_file()]
+    regex = _glob_regex(pattern)
+    # Like pathlib, wildcards also match hidden files
+    return [Path(path) for name, path in entries if regex.match(os.path.normcase(name))]
+
+
+def _escape_pairs(config: Dict) -> tuple:
+    """Return a config's template escape sequences as hashable (original, replacement) pairs"""
+    template_syntax = config.get('template_syntax') or {}
+    return tuple((template_syntax.get('escape_sequences') or {}).items())
+
+
+def _unescape_template(template: str) -> str:
+    """Resolve escaped newlines and quotes left in JSON template strings"""
+    return template.replace('\\n', '\n').replace('\\"', '"')
+
+
+def _file_stamp(path: Path) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _LazyConfigs(Mapping):
+    """Read-only mapping of config stem -> config, loaded on first access.
+
+    Every access stats the file and reloads the config if its (mtime, size) changed.
+    """
+
+    def __init__(self, paths: Dict[str, Path], loader):
+        self._paths = paths
+        self._loader = loader
+        self._loaded = {}
+
+    def __getitem__(self, key: str) -> Dict:
+        path = self._paths[key]
+        stamp = _file_stamp(path)
+        if stamp is None:
+            # Removed since the directory was scanned
+            self._loaded.pop(key, None)
+            return {}
+        entry = self._loaded.get(key)
+        if entry is None or entry[0] != stamp:
+            entry = self._loaded[key] = (stamp, self._loader(path))
+        return entry[1]
+
+    def __contains__(self, key) -> bool:
+        # Membership is by indexed file; Mapping's default would load the config
+        return key in self._paths
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def set_paths(self, paths: Dict[str, Path]):
+        """Replace the indexed files, forgetting configs whose file is gone"""
+        self._paths = paths
+        for key in [key for key in self._loaded if key not in paths]:
+            del self._loaded[key]
+
+    def load_all(self):
+        """Load every config not yet accessed"""
+        for key in self._paths:
+            self[key]
+
+    def items(self):
+        self.load_all()
+        return super().items()
+
+    def values(self):
+        self.load_all()
+        return super().values()
+
 
 class GenericRunner:
     """Pure generic configuration-driven runner with zero domain knowledge"""
@@ -25,23 +392,97 @@ class GenericRunner:
     def __init__(self, config_dir: str = None):
         """Initialize with configuration directory"""
         if config_dir is None:
-            config_dir = Path(__file__).parent.parent / "configs"
+            config_dir = DEFAULT_CONFIG_DIR
         self.config_dir = Path(config_dir)
-        self.configs = {}
         self.load_configs()
 
+        # Load .env once and snapshot the environment; it is fixed for the process lifetime
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            # .env file loading is optional
+            pass
+        self._env = os.environ.copy()
+        # (unescaped text, static bytes) per template file, validated by (mtime_ns, size)
+        self._template_cache: Dict[Path, tuple] = {}
+
     def load_configs(self):
-        """Load all JSON configuration files"""
-        for config_file in self.config_dir.glob("*.json"):
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                if config:
-                    name = config_file.stem
-                    self.configs[name] = config
-                    print(f"Loaded JSON config: {config.get('name', name)}")
-            except Exception as e:
-                print(f"Error loading {config_file}: {e}")
+        """Index JSON configuration files; each is parsed on first access"""
+        # Lowercased config 'name' field -> stem; rebuilt after any config (re)loads
+        self._by_name = None
+        self.configs = _LazyConfigs(self._scan_config_dir(), self._load_config)
+
+    def refresh_configs(self):
+        """Re-scan the config directory for added or removed files; edited files reload on access"""
+        self.configs.set_paths(self._scan_config_dir())
+        self._by_name = None
+
+    def _scan_config_dir(self) -> Dict[str, Path]:
+        """Map stem -> path for the JSON files in the config directory, in one scandir pass"""
+        paths = {}
+        try:
+            with os.scandir(self.config_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        config_file = Path(entry.path)
+                        paths[config_file.stem] = config_file
+        except FileNotFoundError:
+            # No config directory: no runners available
+            pass
+        return paths
+
+    def _load_config(self, config_file: Path) -> Dict:
+        """Load one config; {} if unreadable"""
+        try:
+            config = self._parse_config_file(config_file)
+            if config:
+                # Malformed sections (e.g. a non-dict 'understands' entry) fail here,
+                # so the bad file is skipped like one that does not parse
+                self._prepare_config(config)
+        except Exception as e:
+            print(f"Error loading {config_file}: {e}")
+            return {}
+
+        # The name index may now point at a replaced config
+        self._by_name = None
+        if config:
+            print(f"Loaded JSON config: {config.get('name', config_file.stem)}")
+        return config or {}
+
+    @staticmethod
+    def _prepare_config(config: Dict):
+        """Pre-process skill templates and method resolution once so run() does not repeat it"""
+        # Resolution depends only on which params are present unless a rule or
+        # understanding inspects values; only then is it unsafe to memoize
+        value_dependent = (
+            any('patterns' in (rule.get('condition') or {})
+                for rule in (config.get('method_resolution') or {}).values())
+            or any(details.get('keywords')
+                   for details in (config.get('understands') or {}).values())
+        )
+        config['_method_cache'] = None if value_dependent else {}
+        for details in (config.get('understands') or {}).values():
+            details['_keywords_lower'] = [keyword.lower() for keyword in details.get('keywords', [])]
+        config['_units'] = _result_units(config)
+        config['_escapes'] = _escape_pairs(config)
+        for rule_spec in (config.get('result_assets') or {}).values():
+            rule_spec['_requires_data'] = frozenset(rule_spec.get('conditions', {}).get('requires_data', ()))
+
+        for method_config in config.get('skills', {}).values():
+            if not isinstance(method_config, dict):
+                continue
+            input_template = method_config.get('input_template')
+            if input_template:
+                if isinstance(input_template, list):
+                    input_template = '\n'.join(input_template)
+                method_config['_input_compiled'] = _unescape_template(input_template)
+                method_config['_input_static'] = _static_render(method_config['_input_compiled'])
+
+    @staticmethod
+    def _parse_config_file(config_file: Path) -> Dict:
+        """Parse a single JSON config file"""
+        return _load_json_file(config_file)
 
 
     def run(self, runner_kind: str, run_obj: Run, assets: List[Asset], params: Dict[str, Any]) -> Dict[str, Any]:
@@ -52,51 +493,50 @@ class GenericRunner:
 
         # Update run status
         run_obj.status = "running"
-        run_obj.started_at = datetime.utcnow().isoformat()
+        run_obj.started_at = _utc_timestamp()
 
         try:
             # Determine method using config logic only
             method = self._resolve_method(config, params)
 
             # Get method configuration for execution
-            method_config = config.get('skills', {}).get(method)
+            skills = config.get('skills') or {}
+            method_config = skills.get(method)
             if not method_config:
-                available_skills = list(config.get('skills', {}).keys())
+                available_skills = list(skills.keys())
                 raise ValueError(f"No method configuration found for: {method}. Available skills: {available_skills}")
 
-            print(f"▶ {config.get('name')} {method}")
+            config_name = config.get('name')
+            print(f"▶ {config_name} {method}")
 
-            # Handle input templates if specified
+            # Resolve what this skill renders and executes up front, so metadata-only
+            # skills go straight to output assets without any parameter handling
             input_template = method_config.get('input_template')
             template_file = method_config.get('template_file')
+            script_template = method_config.get('script_template', method_config.get('script', ''))
+            if template_file or input_template or script_template:
+                default_parameters = method_config.get('default_parameters') or {}
 
             if template_file or input_template:
-                # Start with parameter defaults from method config
-                default_parameters = method_config.get('default_parameters', {})
-                format_params = default_parameters.copy()
-
-                # Log parameter defaults being used
-                if default_parameters:
-                    defaults_used = []
-                    for key, default_value in default_parameters.items():
-                        if key not in params:
-                            defaults_used.append(f"{key}={default_value}")
-
+                # Derived values go into the front map; params and defaults are not copied
+                format_params = ChainMap({}, params, default_parameters)
+
+                # Log parameter defaults used and overridden (only built when debugging)
+                verbose = logger.isEnabledFor(logging.DEBUG)
+                if verbose and default_parameters:
+                    defaults_used = [f"{key}={default_value}"
+                                     for key, default_value in default_parameters.items()
+                                     if key not in params]
                     if defaults_used:
-                        print(f"  Using defaults: {', '.join(defaults_used)}")
+                        logger.debug("Using defaults: %s", ', '.join(defaults_used))
 
-                # Override with actual parameters
-                format_params.update(params)
-
-                # Log which parameters were overridden
-                if default_parameters:
                     overrides = []
-                    for key in params:
-                        if key in default_parameters and params[key] != default_parameters[key]:
-                            overrides.append(f"{key}: {default_parameters[key]} → {params[key]}")
-
+                    for key, value in params.items():
+                        default = default_parameters.get(key, _MISSING)
+                        if default is not _MISSING and value != default:
+                            overrides.append(f"{key}: {default} → {value}")
                     if overrides:
-                        print(f"  Parameter overrides: {', '.join(overrides)}")
+                        logger.debug("Parameter overrides: %s", ', '.join(overrides))
 
                 # Handle special parameter transformations
                 calculated_params = []
@@ -117,10 +557,8 @@ class GenericRunner:
 
                 # Generate mass commands and calculate atom_types
                 if 'masses' in format_params:
-                    mass_commands = []
-                    for i, mass in enumerate(format_params['masses'], 1):
-                        mass_commands.append(f"mass {i} {mass}")
-                    format_params['mass_commands'] = "\\n".join(mass_commands)
+                    format_params['mass_commands'] = "\n".join(
+                        f"mass {i} {mass}" for i, mass in enumerate(format_params['masses'], 1))
                     calculated_params.append(f"mass_commands from masses={format_params['masses']}")
 
                     # Calculate atom_types from number of masses if not explicitly set
@@ -136,76 +574,61 @@ class GenericRunner:
 
                 # Generate pair_coeff commands
                 if 'pair_coeffs' in format_params:
-                    pair_coeff_commands = []
-                    for coeff in format_params['pair_coeffs']:
-                        i = coeff.get('i', 1)
-                        j = coeff.get('j', 1)
-                        epsilon = coeff.get('epsilon', 1.0)
-                        sigma = coeff.get('sigma', 1.0)
-                        pair_coeff_commands.append(f"pair_coeff {i} {j} {epsilon} {sigma}")
-                    format_params['pair_coeff_commands'] = "\\n".join(pair_coeff_commands)
+                    format_params['pair_coeff_commands'] = "\n".join(
+                        f"pair_coeff {coeff.get('i', 1)} {coeff.get('j', 1)} "
+                        f"{coeff.get('epsilon', 1.0)} {coeff.get('sigma', 1.0)}"
+                        for coeff in format_params['pair_coeffs'])
                     calculated_params.append(f"pair_coeff_commands from {len(format_params['pair_coeffs'])} pair interactions")
                 else:
                     format_params['pair_coeff_commands'] = "pair_coeff 1 1 1.0 1.0"
                     calculated_params.append("pair_coeff_commands=default LJ interaction")
 
                 # Log all calculated parameters
-                if calculated_params:
-                    print(f"  Calculated parameters: {', '.join(calculated_params)}")
+                if verbose and calculated_params:
+                    logger.debug("Calculated parameters: %s", ', '.join(calculated_params))
 
                 # Get template content
                 if template_file:
                     # Load from file
                     template_path = Path(template_file)
                     if not template_path.is_absolute():
-                        template_path = Path(__file__).parent.parent / template_file
+                        template_path = PACKAGE_ROOT / template_file
 
                     try:
-                        with open(template_path, 'r') as f:
-                            template_content = f.read()
+                        template_content, static_bytes = self._read_template_file(template_path)
                     except FileNotFoundError:
                         raise ValueError(f"Template file not found: {template_path}")
                 else:
-                    # Use inline template - handle both string and array formats
-                    if isinstance(input_template, list):
-                        template_content = '\n'.join(input_template)
-                    else:
-                        template_content = input_template
+                    # Inline template, joined and unescaped when the config was loaded
+                    template_content = method_config['_input_compiled']
+                    static_bytes = method_config.get('_input_static')
 
-                # Substitute parameters in template content
-                try:
-                    # Handle escaped newlines in JSON strings
-                    template_content = template_content.replace('\\n', '\n').replace('\\"', '"')
-                    formatted_content = template_content.format(**format_params)
-                except KeyError as e:
-                    raise ValueError(f"Missing parameter in template: {e}. Available: {list(format_params.keys())}")
+                # Substitute parameters in template content; templates without fields are pre-rendered
+                if static_bytes is None:
+                    try:
+                        formatted_content = template_content.format_map(format_params)
+                    except KeyError as e:
+                        raise ValueError(f"Missing parameter in template: {e}. Available: {list(format_params.keys())}")
+                    static_bytes = formatted_content.encode('utf-8')
 
                 # Write the input file
-                with open('input.lammps', 'w') as f:
-                    f.write(formatted_content)
+                Path('input.lammps').write_bytes(static_bytes)
 
                 print(f"  Generated input file")
 
             # Execute the script template
-            script_template = method_config.get('script_template', method_config.get('script', ''))
             if script_template:
-                # Start with parameter defaults from method config
-                script_default_parameters = method_config.get('default_parameters', {})
-                format_params = script_default_parameters.copy()
-
-                # Log script parameter defaults being used (only new ones not already logged)
-                if script_default_parameters:
-                    script_defaults_used = []
-                    for key, default_value in script_default_parameters.items():
-                        if key not in params:
-                            script_defaults_used.append(f"{key}={default_value}")
-
-                    # Only log if we haven't already logged these defaults
-                    if script_defaults_used and not (input_template or template_file):
-                        print(f"  Using script defaults: {', '.join(script_defaults_used)}")
-
-                # Override with actual parameters
-                format_params.update(params)
+                format_params = _BlankMissing(_optional_placeholders(script_template),
+                                              {}, params, default_parameters)
+
+                # Log script parameter defaults, unless already logged for the input template
+                if (default_parameters and not (input_template or template_file)
+                        and logger.isEnabledFor(logging.DEBUG)):
+                    script_defaults_used = [f"{key}={default_value}"
+                                            for key, default_value in default_parameters.items()
+                                            if key not in params]
+                    if script_defaults_used:
+                        logger.debug("Using script defaults: %s", ', '.join(script_defaults_used))
 
                 # Handle special parameter transformations
                 if 'supercell' in params and isinstance(params['supercell'], list):
@@ -220,25 +643,16 @@ class GenericRunner:
 
                 # Substitute parameters in script, handling missing optional parameters
                 try:
-                    # First, ensure all expected placeholders have values or empty strings
-                    import re
-                    placeholders = re.findall(r'\{(\w+)\}', script_template)
-                    for placeholder in placeholders:
-                        if placeholder not in format_params:
-                            format_params[placeholder] = ''
-                    formatted_script = script_template.format(**format_params)
+                    # Placeholders without a value render as empty strings
+                    formatted_script = script_template.format_map(format_params)
                 except KeyError as e:
-                    raise ValueError(f"Missing parameter in script template: {e}. Available: {list(format_params.keys())}")
+                    available = list(format_params.keys())
+                    available += [key for key in format_params.optional if key not in format_params]
+                    raise ValueError(f"Missing parameter in script template: {e}. Available: {available}")
 
-                # Load .env file and substitute environment variables
-                import string
-                try:
-                    from dotenv import load_dotenv
-                    load_dotenv()
-                except ImportError:
-                    # .env file loading is optional
-                    pass
-                formatted_script = string.Template(formatted_script).safe_substitute(os.environ)
+                # Substitute environment variables (snapshot taken at construction)
+                if '$' in formatted_script:
+                    formatted_script = string.Template(formatted_script).safe_substitute(self._env)
                 print(f"  Executing...")
 
                 import subprocess
@@ -249,36 +663,44 @@ class GenericRunner:
 
                 if method_timeout:
                     timeout = method_timeout
-                    print(f"  Using method-specific timeout: {timeout}s")
+                    logger.debug("Using method-specific timeout: %ss", timeout)
                 elif global_timeout:
                     timeout = global_timeout
-                    print(f"  Using global config timeout: {timeout}s")
+                    logger.debug("Using global config timeout: %ss", timeout)
                 else:
                     timeout = default_timeout
-                    print(f"  Using default timeout: {timeout}s")
-
-                result = subprocess.run(
-                    formatted_script,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout
-                )
+                    logger.debug("Using default timeout: %ss", timeout)
 
-                if result.returncode == 0:
-                    print(f"  ✓ Completed")
-                    run_obj.status = "done"
-                else:
-                    print(f"  ✗ Failed: {result.stderr.strip()}")
+                # stdout is never read, so discard it; only stderr is kept in memory
+                args, use_shell = _command_args(formatted_script)
+                try:
+                    result = _run_command(
+                        subprocess.run, formatted_script, args, use_shell,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        timeout=timeout
+                    )
+                except FileNotFoundError as e:
+                    # Same outcome as the shell reporting an unknown command
+                    print(f"  ✗ Failed: {e}")
                     run_obj.status = "error"
+                else:
+                    if result.returncode == 0:
+                        print(f"  ✓ Completed")
+                        run_obj.status = "done"
+                    else:
+                        print(f"  ✗ Failed: {result.stderr.decode(errors='replace').strip()}")
+                        run_obj.status = "error"
             else:
                 print("  No script defined")
                 run_obj.status = "done"
 
-            run_obj.ended_at = datetime.utcnow().isoformat()
+            run_obj.ended_at = _utc_timestamp()
 
             # Create simple output assets based on method outputs
-            assets_to_return = []
+            # Build the serialized forms directly; callers only consume dicts
+            asset_dicts = []
+            edge_dicts = []
             outputs = method_config.get('outputs', [])
             for output_spec in outputs:
                 # Handle both old dict format and new array format
@@ -292,99 +714,137 @@ class GenericRunner:
                     output_file = f"{output_name}.dat"
                     output_type = 'data'
 
-                asset = Asset(
-                    type="Artifact",
-                    id=generate_id("Artifact"),
-                    payload={
+                output_id = generate_id("Artifact")
+                asset_dicts.append({
+                    "type": "Artifact",
+                    "id": output_id,
+                    "payload": {
                         "name": output_name,
-                        "content": f"Mock {output_name} data from {config.get('name')}",
+                        "content": f"Mock {output_name} data from {config_name}",
                         "method": method,
                         "parameters": params,
                         "output_type": output_type
                     },
-                    uri=f"mock://{output_file}",
-                    hash="mock_hash_" + generate_id("hash")[:8]
-                )
-                assets_to_return.append(asset)
-
-            # Create edges linking the run to produced assets
-            from common.schema import Edge
-            edges_to_return = []
-            for asset in assets_to_return:
-                edge = Edge(
-                    from_id=run_obj.id,
-                    to_id=asset.id,
-                    rel="PRODUCES",
-                    t=run_obj.ended_at
-                )
-                edges_to_return.append(edge)
+                    "uri": f"mock://{output_file}",
+                    "hash": "mock_hash_" + generate_id("hash")[:8]
+                })
+                # Link the run to the produced asset
+                edge_dicts.append({
+                    "from": run_obj.id,
+                    "to": output_id,
+                    "rel": "PRODUCES",
+                    "t": run_obj.ended_at
+                })
 
             return {
-                "assets": [asset.to_dict() for asset in assets_to_return],
-                "edges": [edge.to_dict() for edge in edges_to_return],
+                "assets": asset_dicts,
+                "edges": edge_dicts,
                 "run": run_obj
             }
 
         except Exception as e:
             run_obj.status = "error"
-            run_obj.ended_at = datetime.utcnow().isoformat()
+            run_obj.ended_at = _utc_timestamp()
             print(f"Error in GenericRunner: {e}")
             raise e
 
+    def _read_template_file(self, template_path: Path) -> tuple:
+        """Return (unescaped text, pre-rendered bytes or None) for a template file, re-reading only when it changes"""
+        st = template_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._template_cache.get(template_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        content = _unescape_template(template_path.read_text(encoding='utf-8'))
+        entry = (content, _static_render(content))
+        self._template_cache[template_path] = (stamp, entry)
+        return entry
+
     def _find_config(self, runner_kind: str) -> Dict:
         """Find configuration for runner_kind using only config data"""
         # Handle None or empty runner_kind
         if not runner_kind:
-            available_names = sorted(set(cfg.get('name', key) for key, cfg in self.configs.items()))
+            available_names = sorted(set(cfg.get('name', key) for key, cfg in self.configs.items() if cfg))
             raise ValueError(f"No runner_kind specified. Available runners: {available_names}")
 
-        config = None
+        lowered = runner_kind.lower()
+        config = self._lookup_config(lowered)
+        if config is None:
+            # Pick up config files added to the directory since it was scanned
+            self.refresh_configs()
+            config = self._lookup_config(lowered)
 
-        # Try exact matches first
-        for key in [runner_kind.lower(), runner_kind.lower().replace(' ', '_')]:
-            if key in self.configs:
-                config = self.configs[key]
-                break
-
-        # Try matching by name field in configs
         if not config:
-            for key, cfg in self.configs.items():
-                if cfg.get('name', '').lower() == runner_kind.lower():
-                    config = cfg
-                    break
-
-        if not config:
-            available_names = sorted(set(cfg.get('name', key) for key, cfg in self.configs.items()))
+            available_names = sorted(set(cfg.get('name', key) for key, cfg in self.configs.items() if cfg))
             raise ValueError(f"No configuration found for runner: {runner_kind}. Available runners: {available_names}")
 
         return config
 
+    def _lookup_config(self, lowered: str) -> Optional[Dict]:
+        """Match a lowercased runner kind against file stems, then config 'name' fields"""
+        for key in (lowered, lowered.replace(' ', '_')):
+            if key in self.configs:
+                config = self.configs[key]
+                if config:
+                    return config
+
+        # Trust the name index only while the indexed config still carries that name
+        stem = (self._by_name or {}).get(lowered)
+        if stem in self.configs:
+            config = self.configs[stem]
+            if config and config.get('name', stem).lower() == lowered:
+                return config
+
+        self.configs.load_all()
+        if self._by_name is None:
+            by_name = {}
+            for key, cfg in self.configs.items():
+                if cfg:
+                    by_name.setdefault(cfg.get('name', key).lower(), key)
+            self._by_name = by_name
+        stem = self._by_name.get(lowered)
+        return self.configs[stem] if stem is not None else None
+
     def _resolve_method(self, config: Dict, params: Dict) -> str:
         """Resolve method using config's resolution logic"""
         # First check if method is explicitly provided
+        skills = config.get('skills') or {}
         if 'method' in params:
             method = params['method']
             # Validate the method exists in config
-            if method in config.get('skills', {}):
+            if method in skills:
                 return method
             else:
-                print(f"Warning: Method '{method}' not found in config. Available skills: {list(config.get('skills', {}).keys())}")
-
+                print(f"Warning: Method '{method}' not found in config. Available skills: {list(skills.keys())}")
+
+        # Rule-based resolution, memoized on the set of param names when the config allows it
+        method_cache = config.get('_method_cache')
+        if method_cache is None:
+            return self._resolve_method_by_rules(config, params, skills)
+        key = frozenset(params)
+        method = method_cache.get(key)
+        if method is None:
+            method = method_cache[key] = self._resolve_method_by_rules(config, params, skills)
+        return method
+
+    def _resolve_method_by_rules(self, config: Dict, params: Dict, skills: Dict) -> str:
+        """Resolve method from resolution rules, understandings, then the first skill"""
         # Use config's method resolution rules
-        method_rules = config.get('method_resolution', {})
+        method_rules = config.get('method_resolution') or {}
 
         for rule_name, rule_spec in method_rules.items():
             if self._evaluate_rule(rule_spec.get('condition', {}), params):
                 return rule_spec.get('method', rule_name)
 
         # Fall back to config's inference logic
-        understands = config.get('understands', {})
-        for phrase, details in understands.items():
-            if self._matches_understanding(phrase, details, params):
-                return details.get('method', phrase)
+        understands = config.get('understands') or {}
+        if understands:
+            param_blob = ' '.join(str(v) for v in params.values()).lower()
+            for phrase, details in understands.items():
+                if self._matches_understanding(phrase, details, param_blob):
+                    return details.get('method', phrase)
 
         # Use first available skill from skills dict
-        skills = config.get('skills', {})
         if skills:
             return list(skills.keys())[0]
 
@@ -410,43 +870,35 @@ class GenericRunner:
             for param_name, pattern in condition['patterns'].items():
                 if param_name in params:
                     value = str(params[param_name])
-                    if re.search(pattern, value):
+                    if _compile(pattern).search(value):
                         return True
 
         return False
 
-    def _matches_understanding(self, phrase: str, details: Dict, params: Dict) -> bool:
-        """Check if params match an understanding phrase"""
+    def _matches_understanding(self, phrase: str, details: Dict, param_blob: str) -> bool:
+        """Check if the lowercased, space-joined param values match an understanding phrase"""
         # Simple keyword matching - can be enhanced based on config
-        keywords = details.get('keywords', [])
-        param_values = ' '.join(str(v) for v in params.values()).lower()
+        keywords = details.get('_keywords_lower')
+        if keywords is None:
+            keywords = [keyword.lower() for keyword in details.get('keywords', [])]
 
-        return any(keyword.lower() in param_values for keyword in keywords)
+        return any(keyword in param_blob for keyword in keywords)
 
     def _validate_requirements(self, template_config: Dict, asset_map: Dict, params: Dict, config: Dict):
         """Validate requirements using config's validation rules"""
-        needs = template_config.get('needs', [])
-        param_mapping = config.get('parameter_mapping', {})
+        needs = template_config.get('needs')
+        if not needs:
+            return
+        param_mapping = config.get('parameter_mapping') or {}
+
+        # Everything that can satisfy a need: asset types, params, and
+        # canonical names with an alias present in params
+        available = asset_map.keys() | params.keys()
+        available.update(canonical for canonical, aliases in param_mapping.items()
+                         if not params.keys().isdisjoint(aliases))
 
         for need in needs:
-            found = False
-
-            # Check assets
-            if need in asset_map:
-                found = True
-
-            # Check params with mapping
-            if need in params:
-                found = True
-            elif need in param_mapping:
-                # Check all aliases for this parameter
-                aliases = param_mapping[need]
-                for alias in aliases:
-                    if alias in params:
-                        found = True
-                        break
-
-            if not found:
+            if need not in available:
                 print(f"Available params: {list(params.keys())}")
                 print(f"Available assets: {list(asset_map.keys())}")
                 print(f"Need: {need}, mapping: {param_mapping.get(need, [])}")
@@ -454,89 +906,91 @@ class GenericRunner:
 
     def _organize_assets(self, assets: List[Asset]) -> Dict[str, Asset]:
         """Organize assets by type - purely generic"""
-        asset_map = {}
-        for asset in assets:
-            asset_type = asset.type.lower()
-            asset_map[asset_type] = asset
-        return asset_map
+        return {asset.type.lower(): asset for asset in assets}
 
     def _generate_files(self, template_config: Dict, config: Dict,
                        asset_map: Dict, params: Dict, tmppath: Path) -> Dict[str, Path]:
         """Generate all files from templates using config specifications"""
-        generated = {}
+        # Render everything first, then write each file as one encoded block
+        rendered = []
 
-        files_config = template_config.get('files', {})
+        files_config = template_config.get('files') or {}
+        # One context serves every file rendered in this run
+        context = self._build_template_context(config, asset_map, params) if files_config else None
         for file_key, file_spec in files_config.items():
             filename = file_spec.get('name', file_key)
 
             if 'content' in file_spec:
                 # Template-based generation
                 content = self._render_template(
-                    file_spec['content'], config, asset_map, params
+                    file_spec['content'], config, asset_map, params, context
                 )
             elif 'generator' in file_spec:
                 # Use a generator function defined in config
                 content = self._run_generator(
-                    file_spec['generator'], config, asset_map, params
+                    file_spec['generator'], config, asset_map, params, context
                 )
             else:
                 content = ""
 
-            filepath = tmppath / filename
-            with open(filepath, 'w') as f:
-                f.write(content)
+            rendered.append((file_key, filename, content))
 
+        generated = {}
+        for file_key, filename, content in rendered:
+            filepath = tmppath / filename
+            filepath.write_bytes(content.encode('utf-8'))
             generated[file_key] = filepath
             print(f"Generated: {filename}")
 
         return generated
 
-    def _render_template(self, template: str, config: Dict, asset_map: Dict, params: Dict) -> str:
-        """Render template using config's context rules"""
-        # Build context from config specifications
-        context = self._build_template_context(config, asset_map, params)
-
-        # Handle special template syntax (e.g., double braces)
-        template_syntax = config.get('template_syntax', {})
-        if 'escape_sequences' in template_syntax:
-            for original, replacement in template_syntax['escape_sequences'].items():
-                template = template.replace(original, replacement)
+    def _render_template(self, template: str, config: Dict, asset_map: Dict, params: Dict,
+                         context: Optional[Dict] = None) -> str:
+        """Render template using config's context rules (or a context already built for this run)"""
+        if context is None:
+            context = self._build_template_context(config, asset_map, params)
 
-        # Use string.Template for substitution
-        template_obj = string.Template(template)
+        # Special template syntax (e.g., double braces) is applied once per template string
+        escapes = config.get('_escapes')
+        if escapes is None:
+            escapes = _escape_pairs(config)
+        template_obj = _template(template, escapes)
 
         try:
             result = template_obj.safe_substitute(**context)
         except Exception as e:
             print(f"Template substitution error: {e}")
-            result = template
+            result = template_obj.template
 
         # Handle array indexing and other post-processing
-        post_processors = config.get('template_post_processors', [])
+        post_processors = config.get('template_post_processors')
+        if not post_processors:
+            return result
+
+        resolve_index = partial(self._resolve_array_index, context=context)
         for processor in post_processors:
             if processor['type'] == 'array_indexing':
-                pattern = processor['pattern']
-                result = re.sub(pattern, lambda m: self._resolve_array_index(m, context), result)
+                result = _compile(processor['pattern']).sub(resolve_index, result)
 
         return result
 
     def _build_template_context(self, config: Dict, asset_map: Dict, params: Dict) -> Dict:
         """Build template context using config's context rules"""
         context = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _utc_timestamp(),
             'seed': 12345,
             **params  # Include all parameters
         }
 
         # Apply parameter mapping to resolve aliases
-        param_mapping = config.get('parameter_mapping', {})
+        param_mapping = config.get('parameter_mapping') or {}
         for canonical_name, aliases in param_mapping.items():
             for alias in aliases:
                 if alias in params and canonical_name not in context:
                     context[canonical_name] = params[alias]
 
         # Apply config's context builders
-        context_builders = config.get('context_builders', {})
+        context_builders = config.get('context_builders') or {}
 
         for builder_name, builder_spec in context_builders.items():
             try:
@@ -582,41 +1036,12 @@ class GenericRunner:
 
     def _compute_value(self, spec: Dict, context: Dict) -> Any:
         """Compute value according to config specification"""
-        computation = spec.get('computation', {})
+        computation = spec.get('computation') or {}
         default_value = spec.get('default', '')
 
         if computation.get('type') == 'formula':
-            # Simple formula evaluation
-            formula = computation.get('formula', '')
-
-            # Simple substitutions for common patterns
-            if 'equil_ps' in context and 'timestep_fs' in context:
-                if 'equil_ps * 1000 / timestep_fs' in formula:
-                    try:
-                        return int(context['equil_ps'] * 1000 / context['timestep_fs'])
-                    except:
-                        pass
-
-            if 'prod_ps' in context and 'timestep_fs' in context:
-                if 'prod_ps * 1000 / timestep_fs' in formula:
-                    try:
-                        return int(context['prod_ps'] * 1000 / context['timestep_fs'])
-                    except:
-                        pass
-
-            if 'supercell' in context:
-                supercell = context['supercell']
-                if isinstance(supercell, list):
-                    if '[0]' in formula:
-                        return supercell[0] if len(supercell) > 0 else 10
-                    elif '[1]' in formula:
-                        return supercell[1] if len(supercell) > 1 else 10
-                    elif '[2]' in formula:
-                        return supercell[2] if len(supercell) > 2 else 10
-                else:
-                    return supercell
-
-            return computation.get('default', default_value)
+            evaluate = _compile_formula(computation.get('formula', ''))
+            return evaluate(context, computation.get('default', default_value))
 
         return default_value
 
@@ -631,9 +1056,10 @@ class GenericRunner:
 
         return match.group(0)  # Return original if not found
 
-    def _run_generator(self, generator_name: str, config: Dict, asset_map: Dict, params: Dict) -> str:
+    def _run_generator(self, generator_name: str, config: Dict, asset_map: Dict, params: Dict,
+                       context: Optional[Dict] = None) -> str:
         """Run a generator function defined in config"""
-        generators = config.get('generators', {})
+        generators = config.get('generators') or {}
         if generator_name not in generators:
             return ""
 
@@ -641,7 +1067,7 @@ class GenericRunner:
         generator_type = generator_spec['type']
 
         if generator_type == 'template':
-            return self._render_template(generator_spec['template'], config, asset_map, params)
+            return self._render_template(generator_spec['template'], config, asset_map, params, context)
         elif generator_type == 'data_file':
             return self._generate_data_file(generator_spec, asset_map, params)
 
@@ -653,11 +1079,21 @@ class GenericRunner:
         template = spec.get('template', '')
 
         # Use system asset if available
-        if 'system' in asset_map:
+        if 'system' in asset_map and '{' in template:
             system_data = asset_map['system'].payload
-            # Replace placeholders with system data
-            for key, value in system_data.items():
-                template = template.replace(f'{{{key}}}', str(value))
+            rendered = {}
+
+            def substitute(match):
+                key = match.group(1)
+                if key not in system_data:
+                    return match.group(0)
+                if key not in rendered:
+                    rendered[key] = str(system_data[key])
+                return rendered[key]
+
+            # Replace placeholders with system data in one pass, stringifying
+            # each referenced value (e.g. a large atoms list) only once
+            template = _compile(r'\{([^{}]*)\}').sub(substitute, template)
 
         return template
 
@@ -698,24 +1134,32 @@ class GenericRunner:
 
         command = command_template.format(**template_vars)
 
-        # Set environment from config
-        env = os.environ.copy()
-        for key, value in config.get('environment', {}).items():
-            env[key] = str(value)
+        # Set environment from config on top of the cached process environment
+        config_env = config.get('environment')
+        if config_env:
+            env = {**self._env, **{key: str(value) for key, value in config_env.items()}}
+        else:
+            env = self._env
 
         print(f"Executing: {command}")
         print(f"Working directory: {tmppath}")
 
-        # Execute
-        result = subprocess.run(
-            command, shell=True, cwd=tmppath,
-            capture_output=True, text=True, env=env
-        )
+        timeout = config.get('execution', {}).get('local', {}).get('timeout', LOCAL_EXECUTION_TIMEOUT)
 
-        if result.stdout:
-            print("STDOUT:", result.stdout[:500])
-        if result.stderr:
-            print("STDERR:", result.stderr[:500])
+        args, use_shell = _command_args(command, env.get('PATH'))
+        try:
+            _, stdout_head, stderr_head = _run_command(
+                _run_capturing_head, command, args, use_shell,
+                OUTPUT_PREVIEW_CHARS, timeout, cwd=tmppath, env=env
+            )
+        except FileNotFoundError as e:
+            # Same outcome as the shell reporting an unknown command
+            print("STDERR:", str(e)[:OUTPUT_PREVIEW_CHARS])
+        else:
+            if stdout_head:
+                print("STDOUT:", stdout_head.decode(errors='replace'))
+            if stderr_head:
+                print("STDERR:", stderr_head.decode(errors='replace'))
 
         # Return output files according to config expectations
         return self._find_output_files(tmppath, runner_config)
@@ -737,10 +1181,11 @@ class GenericRunner:
         # Use config's file discovery rules
         file_patterns = config.get('expected_outputs', ['*.dat', '*.txt', '*.json', '*.out'])
 
+        # List the directory once and match every pattern against the listing
+        entries = _scan_files(tmppath)
         for pattern in file_patterns:
-            for filepath in tmppath.glob(pattern):
-                if filepath.is_file():
-                    output_files[filepath.stem] = filepath
+            for filepath in _glob_entries(entries, tmppath, pattern):
+                output_files[filepath.stem] = filepath
 
         return output_files
 
@@ -749,24 +1194,28 @@ class GenericRunner:
         """Parse outputs according to config specifications"""
         results = {}
 
+        entries = None
+        tasks = []
         for file_spec in output_config.get('files', []):
             if 'pattern' in file_spec:
-                # Find files matching pattern
-                pattern = file_spec['pattern']
-                matching_files = list(tmppath.glob(pattern))
-                for filepath in matching_files:
-                    parsed = self._parse_file(filepath, file_spec, config)
-                    results.update(parsed)
+                # Find files matching pattern; the directory is listed once for all specs
+                if entries is None:
+                    entries = _scan_files(tmppath)
+                for filepath in _glob_entries(entries, tmppath, file_spec['pattern']):
+                    tasks.append((filepath, file_spec))
             elif 'name' in file_spec:
                 # Specific file
                 filepath = tmppath / file_spec['name']
                 if filepath.exists():
-                    parsed = self._parse_file(filepath, file_spec, config)
-                    results.update(parsed)
+                    tasks.append((filepath, file_spec))
+
+        # Later files win on key clashes
+        for filepath, file_spec in tasks:
+            results.update(self._parse_file(filepath, file_spec, config))
 
         # Apply config's default results if nothing parsed
         if not results:
-            default_results = config.get('default_results', {})
+            default_results = config.get('default_results') or {}
             results.update(default_results)
 
         return results
@@ -774,7 +1223,7 @@ class GenericRunner:
     def _parse_file(self, filepath: Path, spec: Dict, config: Dict) -> Dict[str, Any]:
         """Parse file according to config parser specifications"""
         parser_name = spec.get('parser', 'simple')
-        parsers = config.get('parsers', {})
+        parsers = config.get('parsers') or {}
 
         if parser_name in parsers:
             parser_spec = parsers[parser_name]
@@ -783,8 +1232,7 @@ class GenericRunner:
         # Fallback parsing
         if filepath.suffix == '.json':
             try:
-                with open(filepath, 'r') as f:
-                    return json.load(f)
+                return _load_json_file(filepath)
             except:
                 return {}
 
@@ -796,18 +1244,21 @@ class GenericRunner:
 
         if parser_type == 'json':
             try:
-                with open(filepath, 'r') as f:
-                    return json.load(f)
+                return _load_json_file(filepath)
             except:
                 return {}
         elif parser_type == 'regex':
-            patterns = parser_spec.get('patterns', [])
             results = {}
             try:
+                compiled = _compile_parser_patterns(tuple(parser_spec.get('patterns', [])),
+                                                    bool(parser_spec.get('anchor', False)))
+                # 'all' (default) lists every match; 'first'/'last' keep one, 'count' only counts
+                mode = parser_spec.get('mode', 'all')
+                # Decode once and scan as str, so patterns keep Unicode semantics
                 with open(filepath, 'r') as f:
                     content = f.read()
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
+                for regex in compiled:
+                    matches = _scan_matches(regex, content, mode)
                     if matches:
                         # Store matches with pattern as key
                         results[f'matches_{len(results)}'] = matches
@@ -817,28 +1268,39 @@ class GenericRunner:
         elif parser_type == 'columnar':
             # Parse columnar data according to spec
             try:
-                with open(filepath, 'r') as f:
-                    lines = f.readlines()
                 skip_lines = parser_spec.get('skip_lines', 0)
-                data_lines = lines[skip_lines:]
-                # Simple columnar parsing - could be enhanced
-                return {'data': [line.strip().split() for line in data_lines if line.strip()]}
+                if parser_spec.get('numeric', False):
+                    return self._parse_numeric_columns(filepath, parser_spec, skip_lines)
+                # Simple columnar parsing - could be enhanced; lines are streamed, not read whole
+                with open(filepath, 'r') as f:
+                    return {'data': [line.split() for line in islice(f, skip_lines, None) if line.strip()]}
             except:
                 return {}
 
         return {}
 
+    def _parse_numeric_columns(self, filepath: Path, parser_spec: Dict, skip_lines: int) -> Dict[str, Any]:
+        """Parse an all-numeric columnar file with NumPy's loader.
+
+        Returns {'data': rows} or, when 'columns' names are given, one list per column;
+        values are plain lists so results stay JSON-serializable.
+        """
+        import numpy as np
+
+        table = np.loadtxt(filepath, skiprows=skip_lines, dtype=parser_spec.get('dtype', 'float64'), ndmin=2)
+        columns = parser_spec.get('columns')
+        if columns:
+            return {name: table[:, i].tolist() for i, name in enumerate(columns)}
+        return {'data': table.tolist()}
+
     def _create_result_assets(self, config: Dict, method: str, results: Dict, params: Dict) -> List[Asset]:
         """Create result assets according to config specifications"""
         assets = []
 
         # Create main results asset
-        results_payload = {
-            'method': method,
-            'runner': config.get('name'),
-            **results,
-            **{k: v for k, v in params.items() if k not in ['method', 'execution_mode']}
-        }
+        results_payload = {'method': method, 'runner': config.get('name')}
+        results_payload.update(results)
+        results_payload.update((k, v) for k, v in params.items() if k not in _EXCLUDED_RESULT_PARAMS)
 
         results_asset = Asset(
             type="Results",
@@ -849,7 +1311,7 @@ class GenericRunner:
         assets.append(results_asset)
 
         # Create additional assets based on config rules
-        asset_rules = config.get('result_assets', {})
+        asset_rules = config.get('result_assets') or {}
         for rule_name, rule_spec in asset_rules.items():
             if self._should_create_asset(rule_spec, results, params):
                 additional_asset = self._create_asset_from_rule(rule_spec, results, params)
@@ -860,15 +1322,13 @@ class GenericRunner:
 
     def _should_create_asset(self, rule_spec: Dict, results: Dict, params: Dict) -> bool:
         """Check if asset should be created based on rule"""
-        conditions = rule_spec.get('conditions', {})
+        # Required result keys, as a frozenset precomputed at config load when available
+        required = rule_spec.get('_requires_data')
+        if required is None:
+            required = frozenset(rule_spec.get('conditions', {}).get('requires_data', ()))
 
         # Check if required data is present
-        if 'requires_data' in conditions:
-            for key in conditions['requires_data']:
-                if key not in results:
-                    return False
-
-        return True
+        return required <= results.keys()
 
     def _create_asset_from_rule(self, rule_spec: Dict, results: Dict, params: Dict) -> Optional[Asset]:
         """Create asset according to rule specification"""
@@ -876,7 +1336,7 @@ class GenericRunner:
 
         payload = {}
         # Extract payload according to rule
-        payload_rules = rule_spec.get('payload', {})
+        payload_rules = rule_spec.get('payload') or {}
         for key, source in payload_rules.items():
             if source in results:
                 payload[key] = results[source]
@@ -894,14 +1354,10 @@ class GenericRunner:
 
     def _extract_units(self, config: Dict, results: Dict) -> Dict[str, str]:
         """Extract units from config specifications"""
-        units = {}
-        results_format = config.get('results', {}).get('format', {})
-
-        for key in results:
-            if key in results_format and 'unit' in results_format[key]:
-                units[key] = results_format[key]['unit']
-
-        return units
+        all_units = config.get('_units')
+        if all_units is None:
+            all_units = _result_units(config)
+        return {key: all_units[key] for key in results if key in all_units}
 
     def _generate_log(self, config: Dict, method: str, params: Dict, results: Dict) -> str:
         """Generate log using config template if available"""
@@ -910,91 +1366,98 @@ class GenericRunner:
             context = {
                 'config_name': config.get('name'),
                 'method': method,
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _utc_timestamp(),
                 'params': params,
                 'results': results
             }
-            return string.Template(log_template).safe_substitute(**context)
+            return _template(log_template).safe_substitute(context)
 
         # Default log format
-        log = f"Run completed: {config.get('name')} - {method}\n"
-        log += f"Timestamp: {datetime.utcnow().isoformat()}\n\n"
-        log += "Parameters:\n"
-        for key, value in params.items():
-            log += f"  {key}: {value}\n"
-        log += "\nResults:\n"
-        for key, value in results.items():
-            log += f"  {key}: {value}\n"
-        return log
+        parts = [
+            f"Run completed: {config.get('name')} - {method}\n",
+            f"Timestamp: {_utc_timestamp()}\n\n",
+            "Parameters:\n",
+        ]
+        parts.extend(f"  {key}: {value}\n" for key, value in params.items())
+        parts.append("\nResults:\n")
+        parts.extend(f"  {key}: {value}\n" for key, value in results.items())
+        return ''.join(parts)
 
     def _log_simulation_parameters(self, params: Dict, config: Dict, method: str):
         """Log detailed simulation parameters using configuration-driven approach"""
-        print(f"Method: {method}")
-        print(f"Runner: {config.get('name', 'Unknown')}")
+        lines = [f"Method: {method}", f"Runner: {config.get('name', 'Unknown')}"]
 
         # Use configuration-driven parameter logging
-        logging_config = config.get('parameter_logging', {})
+        logging_config = config.get('parameter_logging') or {}
 
         if logging_config:
             for param_key, log_spec in logging_config.items():
                 if param_key in params:
-                    self._log_parameter_value(param_key, params[param_key], log_spec)
+                    lines.extend(self._format_parameter_value(param_key, params[param_key], log_spec))
         else:
             # Generic fallback - just log all parameters
             for key, value in params.items():
                 if isinstance(value, list):
-                    print(f"{key.title()}: {', '.join(map(str, value))}")
+                    lines.append(f"{key.title()}: {', '.join(map(str, value))}")
                 else:
-                    print(f"{key.title()}: {value}")
+                    lines.append(f"{key.title()}: {value}")
 
-        print()  # Empty line for readability
+        # Trailing empty line for readability; one write for the whole block
+        lines.append('')
+        sys.stdout.write('\n'.join(lines) + '\n')
 
-    def _log_parameter_value(self, param_key: str, value: Any, log_spec: Dict):
-        """Log a parameter value according to its configuration specification"""
+    def _format_parameter_value(self, param_key: str, value: Any, log_spec: Dict) -> List[str]:
+        """Format a parameter value according to its configuration specification"""
         display_name = log_spec.get('display_name', param_key.title())
         unit = log_spec.get('unit', '')
         format_type = log_spec.get('format', 'default')
 
         if format_type == 'range' and isinstance(value, list):
             unit_str = f" {unit}" if unit else ""
-            print(f"{display_name}: {', '.join(map(str, value))}{unit_str}")
+            lines = [f"{display_name}: {', '.join(map(str, value))}{unit_str}"]
             if len(value) > 1:
-                print(f"{display_name} range: {min(value)} - {max(value)}{unit_str}")
+                lines.append(f"{display_name} range: {min(value)} - {max(value)}{unit_str}")
+            return lines
         elif format_type == 'supercell' and isinstance(value, list) and len(value) == 3:
             total = value[0] * value[1] * value[2]
-            print(f"{display_name}: {value[0]}×{value[1]}×{value[2]} ({total:,} unit cells)")
+            return [f"{display_name}: {value[0]}×{value[1]}×{value[2]} ({total:,} unit cells)"]
         else:
             unit_str = f" {unit}" if unit else ""
-            print(f"{display_name}: {value}{unit_str}")
+            return [f"{display_name}: {value}{unit_str}"]
 
     def _create_edges(self, run_obj: Run, input_assets: List[Asset],
                      results_asset: Asset, log_artifact: Asset) -> List[Edge]:
         """Create lineage edges - purely generic"""
-        edges = []
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = _utc_timestamp()
+        run_id = run_obj.id
 
         # Input assets to run
-        for asset in input_assets:
-            edges.append(Edge(
+        edges = [
+            Edge(
                 from_id=asset.id,
-                to_id=run_obj.id,
+                to_id=run_id,
                 rel="USES" if asset.type == "System" else "CONFIGURES",
                 t=timestamp
-            ))
+            )
+            for asset in input_assets
+        ]
 
         # Run to outputs
-        edges.append(Edge(
-            from_id=run_obj.id,
-            to_id=results_asset.id,
-            rel="PRODUCES",
-            t=timestamp
-        ))
-
-        edges.append(Edge(
-            from_id=run_obj.id,
-            to_id=log_artifact.id,
-            rel="LOGS",
-            t=timestamp
-        ))
-
-        return edges
\ No newline at end of file
+        edges.append(Edge(from_id=run_id, to_id=results_asset.id, rel="PRODUCES", t=timestamp))
+        edges.append(Edge(from_id=run_id, to_id=log_artifact.id, rel="LOGS", t=timestamp))
+
+        return edges
+
+
+def get_runner(config_dir: str = None) -> GenericRunner:
+    """Return the shared GenericRunner for a configuration directory.
+
+    The runner notices edited config files on access and re-scans its
+    directory for new ones when a lookup misses.
+    """
+    return _shared_runner(str(Path(config_dir or DEFAULT_CONFIG_DIR).resolve()))
+
+
+@lru_cache(maxsize=None)
+def _shared_runner(config_dir: str) -> GenericRunner:
+    return GenericRunner(config_dir)
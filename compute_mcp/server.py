@@ -10,7 +10,7 @@ from mcp.types import Tool, TextContent
 
 from common.schema import Asset, Edge, Run
 from common.ids import run_id
-from compute_mcp.generic_runner import GenericRunner
+from compute_mcp.generic_runner import get_runner
 
 # Create MCP server
 app = Server("compute-mcp")
@@ -93,7 +93,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             assets = []
 
             # Use the generic runner with zero domain knowledge
-            runner = GenericRunner()
+            runner = get_runner()
             results = runner.run(runner_kind, run, assets, params)
 
             run_results[run.id] = results
@@ -15,13 +15,15 @@ load_dotenv()
 from common.schema import Asset, Edge
 from common.ids import asset_id, generate_id
 
+DEFAULT_CONFIG_DIR = Path(__file__).parent.parent / "configs"
+
 class InterfacesTools:
     """Tools for planning and explaining computational workflows"""
 
     def __init__(self, config_dir: str = None):
         """Initialize with configuration directory"""
         if config_dir is None:
-            config_dir = Path(__file__).parent.parent / "configs"
+            config_dir = DEFAULT_CONFIG_DIR
         self.config_dir = Path(config_dir)
         self.configs = {}
         self.load_configs()
@@ -2,10 +2,17 @@
 from typing import Dict, List, Optional
 from datetime import datetime
 import json
+import os
 from pathlib import Path
 
 from common.schema import Asset, Edge
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to stdlib json
+    orjson = None
+
 class MemoryStore:
     """In-memory store with optional persistence"""
     
@@ -70,17 +77,30 @@ class MemoryStore:
             "edges": [e.to_dict() for e in self.edges]
         }
         
+        # stdlib json keeps NaN/Infinity and coerces non-str keys, which orjson cannot
+        blob = json.dumps(data, indent=2).encode()
+        
+        # Write to a sibling temp file and rename so a crash never truncates the store
         self.persist_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.persist_path, "w") as f:
-            json.dump(data, f, indent=2)
+        tmp_path = self.persist_path.with_name(self.persist_path.name + ".tmp")
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, self.persist_path)
     
     def _load(self):
         """Load state from disk"""
         if not self.persist_path or not self.persist_path.exists():
             return
         
-        with open(self.persist_path, "r") as f:
-            data = json.load(f)
+        raw = self.persist_path.read_bytes()
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson is strict (e.g. rejects NaN/Infinity written by stdlib json)
+                data = None
+        if data is None:
+            data = json.loads(raw)
         
         self.assets = {
             aid: Asset.from_dict(adict) 